@@ -30,8 +30,9 @@ Example:
     ```
 """
 
-from .scraper import GoogleMapsReviewsScraper, GoogleMapsReviewsScraperSync
+from .scraper import GoogleMapsReviewsScraper, GoogleMapsReviewsScraperSync, ScrapeHTTPError
 from .parser import GoogleMapsResponseParser
+from .models import Review
 from .emulation import BrowserEmulator
 from .logger import setup_logger, get_logger
 
@@ -40,7 +41,9 @@ __author__ = "SamuraiSam"
 __all__ = [
     "GoogleMapsReviewsScraper",
     "GoogleMapsReviewsScraperSync",
+    "ScrapeHTTPError",
     "GoogleMapsResponseParser",
+    "Review",
     "BrowserEmulator",
     "setup_logger",
     "get_logger",
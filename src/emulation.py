@@ -4,7 +4,13 @@ Provides utilities for rotating browser fingerprints to avoid detection.
 """
 
 import random
-from typing import List
+from typing import Any, Dict, Sequence
+
+try:
+    from curl_cffi.requests import AsyncSession
+    CURL_CFFI_AVAILABLE = True
+except ImportError:
+    CURL_CFFI_AVAILABLE = False
 
 
 class BrowserEmulator:
@@ -13,7 +19,7 @@ class BrowserEmulator:
     # Available browser impersonations for curl_cffi (free version)
     # These match real browser TLS fingerprints
     # Source: https://curl-cffi.readthedocs.io/en/latest/
-    IMPERSONATIONS = [
+    IMPERSONATIONS = (
         # Latest Chrome versions (most recommended)
         "chrome136",
         "chrome136",
@@ -40,16 +46,21 @@ class BrowserEmulator:
         # Safari versions
         "safari15_5",
         "safari15_3",
-    ]
-    def __init__(self, impersonations: List[str] = None):
+    )
+    def __init__(self, impersonations: Sequence[str] = None):
         """
         Initialize browser emulator.
         Args:
             impersonations: List of impersonation types to rotate through.
                            If None, uses default set of Chrome, Edge, Safari.
         """
-        self.impersonations = impersonations if impersonations else self.IMPERSONATIONS.copy()
+        # Stored as a tuple so the default set is shared rather than copied
+        self.impersonations = (
+            tuple(impersonations) if impersonations else self.IMPERSONATIONS
+        )
+        self._n = len(self.impersonations)
         self._index = 0
+        self._sessions: Dict[str, AsyncSession] = {}
     
     def get_random(self) -> str:
         """
@@ -58,7 +69,7 @@ class BrowserEmulator:
         Returns:
             Random impersonation string
         """  # noqa: W293
-        return random.choice(self.impersonations)
+        return self.impersonations[random.randrange(self._n)]
     
     def get_next(self) -> str:
         """
@@ -68,10 +79,41 @@ class BrowserEmulator:
             Next impersonation string in the rotation
         """
         impersonation = self.impersonations[self._index]
-        self._index = (self._index + 1) % len(self.impersonations)
+        self._index = (self._index + 1) % self._n
         return impersonation
     
     def reset(self):
         """Reset the rotation index to the beginning."""
         self._index = 0
-
+    
+    def session_for(self, impersonate: str, **session_kwargs: Any) -> "AsyncSession":
+        """
+        Get the cached session for an impersonation, creating it on first use.
+        
+        Reusing a session keeps its connections (and TLS sessions) alive
+        across requests instead of handshaking again for every request.
+        
+        Args:
+            impersonate: Browser impersonation string
+            **session_kwargs: Extra AsyncSession arguments (e.g. proxies).
+                              Only applied when the session is created.
+        
+        Returns:
+            AsyncSession impersonating the given browser
+        """
+        session = self._sessions.get(impersonate)
+        if session is None:
+            if not CURL_CFFI_AVAILABLE:
+                raise ImportError(
+                    "curl_cffi is required for sessions. Install with: pip install curl_cffi"
+                )
+            session = AsyncSession(impersonate=impersonate, **session_kwargs)
+            self._sessions[impersonate] = session
+        return session
+    
+    async def close_sessions(self):
+        """Close and forget all cached sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
@@ -1,3 +1,4 @@
+import functools
 import logging
 import sys
 from typing import Optional
@@ -16,11 +17,18 @@ class ColoredFormatter(logging.Formatter):
         'RESET': '\033[0m'        # Reset
     }
 
+    # Colored level names, built once instead of per record
+    COLORED_LEVELNAMES = {
+        level: f"{color}{level}\033[0m"
+        for level, color in COLORS.items()
+        if level != 'RESET'
+    }
+
     def format(self, record):
         # Add color to level name
-        levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        record.levelname = self.COLORED_LEVELNAMES.get(
+            record.levelname, record.levelname
+        )
         return super().format(record)
 
 
@@ -69,10 +77,13 @@ def setup_logger(
     return logger
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(name: str = "gmaps_scraper") -> logging.Logger:
     """
     Get or create logger instance.
 
+    Loggers are process-wide singletons, so the lookup is memoized per name.
+
     Args:
         name: Logger name
 
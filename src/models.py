@@ -0,0 +1,100 @@
+"""
+Data models for scraped Google Maps reviews.
+"""
+
+import operator
+from typing import Any, Dict, Optional, Tuple
+
+# Field order used for Review slots and for serialized review dictionaries
+REVIEW_FIELDS: Tuple[str, ...] = (
+    "review_id",
+    "user_name",
+    "user_url",
+    "user_reviews",
+    "rating",
+    "relative_date",
+    "text",
+    "text_date",
+    "translated_text",
+    "likes",
+    "response_text",
+    "response_relative_date",
+    "response_text_date",
+    "translated_response_text",
+    "retrieval_date",
+)
+
+# Reads every field of a Review in REVIEW_FIELDS order in one call
+_FIELD_VALUES = operator.attrgetter(*REVIEW_FIELDS)
+
+
+class Review:
+    """
+    A single Google Maps review.
+
+    Uses __slots__ instead of a per-instance dict, which keeps memory low when
+    thousands of reviews are held during a scrape. Call to_dict() to get the
+    plain dictionary form returned by the scraper.
+    """
+
+    __slots__ = REVIEW_FIELDS
+
+    def __init__(
+        self,
+        review_id: str = "",
+        user_name: str = "",
+        user_url: str = "",
+        user_reviews: int = 0,
+        rating: float = 0.0,
+        relative_date: str = "",
+        text: str = "",
+        text_date: Optional[str] = None,
+        translated_text: str = "",
+        likes: int = 0,
+        response_text: str = "",
+        response_relative_date: str = "",
+        response_text_date: Optional[str] = None,
+        translated_response_text: str = "",
+        retrieval_date: str = "",
+    ):
+        self.review_id = review_id
+        self.user_name = user_name
+        self.user_url = user_url
+        self.user_reviews = user_reviews
+        self.rating = rating
+        self.relative_date = relative_date
+        self.text = text
+        self.text_date = text_date
+        self.translated_text = translated_text
+        self.likes = likes
+        self.response_text = response_text
+        self.response_relative_date = response_relative_date
+        self.response_text_date = response_text_date
+        self.translated_response_text = translated_response_text
+        self.retrieval_date = retrieval_date
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the review to a dictionary.
+
+        Returns:
+            Dictionary with one key per review field
+        """
+        return {field: getattr(self, field) for field in REVIEW_FIELDS}
+
+    def to_tuple(self) -> Tuple[Any, ...]:
+        """
+        Convert the review to a tuple of field values.
+
+        Returns:
+            Tuple of values in REVIEW_FIELDS order
+        """
+        return _FIELD_VALUES(self)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Review):
+            return NotImplemented
+        return _FIELD_VALUES(self) == _FIELD_VALUES(other)
+
+    def __repr__(self) -> str:
+        return f"Review(review_id={self.review_id!r}, user_name={self.user_name!r})"
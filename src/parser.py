@@ -1,10 +1,124 @@
+import functools
 import json
 import re
+import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Any, Optional, Union, cast
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
 
-from .time_utils import parse_relative_date
 from .logger import get_logger
+from .models import REVIEW_FIELDS, Review
+from .time_utils import iso_from_micros, parse_relative_date, reference_datetime
+
+_LOGGER = get_logger()
+
+# simdjson parsers keep their buffers allocated between documents but are not
+# thread-safe, and responses may be parsed in executor threads
+_simdjson_local = threading.local()
+
+
+def _get_simdjson_parser() -> "simdjson.Parser":
+    """Return the simdjson parser for the current thread, creating it once."""
+    parser = getattr(_simdjson_local, "parser", None)
+    if parser is None:
+        parser = _simdjson_local.parser = simdjson.Parser()
+    return parser
+
+
+class _PrefixStrippedStream:
+    """
+    Binary file-like view over a stream or byte chunks that drops the ")]}'"
+    security prefix.
+
+    Reads are buffered until the first 4 bytes (or EOF) are seen, so short
+    reads from raw or network streams cannot leak part of the prefix.
+    """
+
+    _CHUNK_SIZE = 65536
+
+    def __init__(self, source: Union[BinaryIO, Iterable[bytes]]):
+        if hasattr(source, "read"):
+            self._chunks: Iterator[bytes] = iter(
+                functools.partial(source.read, self._CHUNK_SIZE), b""
+            )
+        else:
+            self._chunks = iter(source)
+        head = b""
+        while len(head) < 4:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            head += chunk
+        self._buffer = head[4:] if head[:4] == b")]}'" else head
+
+    def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs str streams
+        if size == 0:
+            return b""
+        if size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+        # Skip empty chunks so they are not mistaken for EOF
+        while not self._buffer:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._buffer = chunk
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+# Fallback for labels whose digits are not ASCII (e.g. Bengali or Arabic-Indic)
+_UNICODE_INT_RE = re.compile(r"\d+")
+
+
+def _leading_int(text: str) -> int:
+    """
+    Read the first integer in a label like "123 reviews" or "1,234 reviews".
+
+    Thousands separators (commas) inside the number are skipped. Labels with
+    no ASCII digit fall back to a Unicode-aware regex, so localized labels
+    (e.g. "১২৩টি পর্যালোচনা") still parse.
+
+    Args:
+        text: Label text
+
+    Returns:
+        Parsed integer, or 0 if the text contains no digits
+    """
+    value = 0
+    seen = False
+    for ch in text:
+        if "0" <= ch <= "9":
+            value = value * 10 + (ord(ch) - 48)
+            seen = True
+        elif ch == "," and seen:
+            continue
+        elif seen:
+            break
+    if not seen:
+        match = _UNICODE_INT_RE.search(text)
+        if match:
+            return int(match.group(0))
+    return value
 
 
 class GoogleMapsResponseParser:
@@ -12,30 +126,120 @@ class GoogleMapsResponseParser:
 
     def __init__(self):
         """Initialize the parser with logger."""
-        self.logger = get_logger()
+        self.logger = _LOGGER
 
-    def parse_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+    def parse_response(
+        self, response_text: Union[str, bytes]
+    ) -> Optional[List[Any]]:
         """
-        Parse the API response text to JSON.
-        
+        Parse the API response body to JSON.
+
+        Uses orjson when installed, then pysimdjson, falling back to the
+        standard json module. Passing the raw response bytes avoids decoding
+        the body to str first.
+
         Args:
-            response_text: Raw response text from the API
+            response_text: Raw response body from the API (str or bytes)
             
         Returns:
-            Parsed JSON data or None if parsing fails
+            Parsed JSON data (the top-level array) or None if parsing fails
         """
-        # Remove security prefix
-        if response_text.startswith(")]}'"):
-            response_text = response_text[4:]
+        # Remove security prefix. Bytes are trimmed through a memoryview so
+        # orjson/simdjson read the body in place instead of copying it
+        payload: Union[str, bytes, memoryview] = response_text
+        if isinstance(response_text, bytes):
+            if response_text[:4] == b")]}'":
+                payload = memoryview(response_text)[4:]
+        elif response_text.startswith(")]}'"):
+            payload = response_text[4:]
         
+        data: Any
         try:
-            data = json.loads(response_text)
-            return data
-        except json.JSONDecodeError as e:
-            self.logger.error(f"JSON parse error: {str(e)[:100]}")
+            if ORJSON_AVAILABLE:
+                data = orjson.loads(payload)
+            elif SIMDJSON_AVAILABLE:
+                # recursive=True materializes plain lists: lazy simdjson proxies
+                # pin the parser and are not the plain lists expected below
+                data = _get_simdjson_parser().parse(payload, True)
+            else:
+                if isinstance(payload, memoryview):
+                    # The stdlib json module does not accept buffer objects
+                    payload = payload.tobytes()
+                data = json.loads(payload)
+        except ValueError as e:
+            # json, orjson and simdjson all raise ValueError subclasses
+            self.logger.error("JSON parse error: %.100s", e)
             return None
+        # The API answers with a top-level JSON array
+        return cast(List[Any], data)
     
-    def extract_pagination_token(self, data: Dict[str, Any]) -> str:
+    def parse_response_streaming(
+        self,
+        stream: Union[BinaryIO, Iterable[bytes]],
+        retrieval_date: Optional[str] = None,
+    ) -> Iterator[Review]:
+        """
+        Incrementally parse an API response and yield its reviews.
+
+        Uses ijson to build one review entry at a time, so peak memory is
+        bounded by the largest review rather than the whole response.
+        
+        Args:
+            stream: Raw response body, either a binary file-like object or an
+                    iterable of byte chunks (e.g. a streamed response's
+                    iter_content())
+            retrieval_date: Retrieval timestamp string. If None, uses current datetime
+            
+        Yields:
+            Review records, in response order
+            
+        Raises:
+            ImportError: If ijson is not installed
+        """
+        if not IJSON_AVAILABLE:
+            raise ImportError(
+                "ijson is required for streaming parsing. Install with: pip install ijson"
+            )
+        if retrieval_date is None:
+            ref_dt = datetime.now()
+            retrieval_date = str(ref_dt)
+        else:
+            ref_dt = reference_datetime(retrieval_date)
+
+        top_index = -1
+        builder = None
+        depth = 0
+        events = ijson.parse(_PrefixStrippedStream(stream), use_float=True)
+        for prefix, event, value in events:
+            # Every non-closing event at prefix "item" starts a new top-level element
+            if prefix == "item" and event not in ("end_array", "end_map", "map_key"):
+                top_index += 1
+                continue
+
+            # Reviews are the elements of the top-level array at index 2
+            if top_index != 2 or not prefix.startswith("item.item"):
+                continue
+            if builder is None:
+                # Only array entries directly inside the reviews array are reviews
+                if prefix != "item.item" or event != "start_array":
+                    continue
+                builder = ijson.ObjectBuilder()
+
+            builder.event(event, value)
+            if event in ("start_array", "start_map"):
+                depth += 1
+            elif event in ("end_array", "end_map"):
+                depth -= 1
+                if depth == 0:
+                    review_item = builder.value
+                    builder = None
+                    if review_item:
+                        # review_item[0] contains the actual review data
+                        yield self.extract_review_data(
+                            review_item[0], retrieval_date, ref_dt=ref_dt
+                        )
+    
+    def extract_pagination_token(self, data: List[Any]) -> str:
         """
         Extract the pagination token from API response.
         
@@ -45,36 +249,100 @@ class GoogleMapsResponseParser:
         Returns:
             Pagination token string or empty string if not found
         """
-        if len(data) > 1 and data[1]:
-            return str(data[1])
-        return ""
+        try:
+            token = data[1]
+        except (LookupError, TypeError):
+            return ""
+        return str(token) if token else ""
+    
+    def iter_reviews(
+        self, data: List[Any], retrieval_date: Optional[str] = None
+    ) -> Iterator[Review]:
+        """
+        Yield reviews from API response data one at a time.
+
+        Lets callers write or filter reviews as they are extracted instead
+        of holding a full list for the page.
+        
+        Args:
+            data: Parsed API response data
+            retrieval_date: Retrieval timestamp string shared by every review on
+                           the page. If None, uses current datetime
+            
+        Yields:
+            Review records
+        """
+        # Extract reviews (usually at index 2); empty pages return before any
+        # other work is done
+        try:
+            reviews_array = data[2]
+        except (LookupError, TypeError):
+            return
+        if not reviews_array or type(reviews_array) is not list:
+            return
+
+        # All reviews on a page share one retrieval timestamp, resolved once
+        # to the datetime that relative dates are calculated from
+        if retrieval_date is None:
+            ref_dt = datetime.now()
+            retrieval_date = str(ref_dt)
+        else:
+            ref_dt = reference_datetime(retrieval_date)
+
+        # review_item[0] contains the actual review data
+        extract = self.extract_review_data
+        for review_item in reviews_array:
+            if type(review_item) is list and review_item:
+                yield extract(review_item[0], retrieval_date, ref_dt=ref_dt)
     
-    def extract_reviews(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def extract_reviews(
+        self, data: List[Any], retrieval_date: Optional[str] = None
+    ) -> List[Review]:
         """
         Extract all reviews from API response data.
         
         Args:
             data: Parsed API response data
+            retrieval_date: Retrieval timestamp string shared by every review on
+                           the page. If None, uses current datetime
             
         Returns:
-            List of review dictionaries
+            List of Review records
         """
-        reviews = []
+        return list(self.iter_reviews(data, retrieval_date))
+    
+    def extract_reviews_columnar(
+        self, data: List[Any], retrieval_date: Optional[str] = None
+    ) -> Dict[str, List[Any]]:
+        """
+        Extract all reviews from API response data as columns.
+
+        Returns one list per review field instead of one record per review,
+        which can be passed straight to e.g. pandas.DataFrame.
         
-        # Extract reviews (usually at index 2)
-        if len(data) > 2 and data[2]:
-            reviews_array = data[2]
+        Args:
+            data: Parsed API response data
+            retrieval_date: Retrieval timestamp string. If None, uses current datetime
             
-            if isinstance(reviews_array, list):
-                for review_item in reviews_array:
-                    if isinstance(review_item, list) and len(review_item) > 0:
-                        # review_item[0] contains the actual review data
-                        review_data = self.extract_review_data(review_item[0])
-                        reviews.append(review_data)
-        
-        return reviews
+        Returns:
+            Dictionary mapping each review field name to a list of values
+        """
+        rows = [review.to_tuple() for review in self.iter_reviews(data, retrieval_date)]
+        if not rows:
+            return {field: [] for field in REVIEW_FIELDS}
+        # Transpose the row tuples into one column per field
+        return {
+            field: list(column)
+            for field, column in zip(REVIEW_FIELDS, zip(*rows))
+        }
     
-    def extract_review_data(self, review_array: List[Any]) -> Dict[str, Any]:
+    def extract_review_data(
+        self,
+        review_array: List[Any],
+        retrieval_date: Optional[str] = None,
+        *,
+        ref_dt: Optional[datetime] = None,
+    ) -> Review:
         """
         Extract review data from the nested array structure.
         
@@ -95,166 +363,181 @@ class GoogleMapsResponseParser:
             
         Args:
             review_array: The nested array containing review data
+            retrieval_date: Retrieval timestamp string. If None, uses current datetime
+            ref_dt: Reference datetime for relative dates. If None, it is
+                    derived from retrieval_date when needed
             
         Returns:
-            Dictionary containing extracted review information
+            Review record containing extracted review information
         """
-        result = {
-            "review_id": "",
-            "user_name": "",
-            "user_url": "",
-            "user_reviews": 0,
-            "rating": 0.0,
-            "relative_date": "",
-            "text": "",
-            "text_date": None,
-            "translated_text": "",
-            "likes": 0,
-            "response_text": "",
-            "response_relative_date": "",
-            "response_text_date": None,
-            "translated_response_text": "",
-            "retrieval_date": str(datetime.now()),
-        }
+        if retrieval_date is None:
+            now = datetime.now()
+            retrieval_date = str(now)
+            if ref_dt is None:
+                ref_dt = now
+
+        # Extracted values are held in locals and the Review is built once at
+        # the end, so each slot is written a single time
+        review_id = user_name = user_url = relative_date = text = ""
+        response_text = response_relative_date = ""
+        user_reviews = 0
+        rating = 0.0
+        text_date = response_text_date = None
         
         try:
             if not review_array or len(review_array) < 2:
-                return result
+                return Review(retrieval_date=retrieval_date)
             
+            # Missing indices and wrong container types surface as LookupError /
+            # TypeError, so each field is guarded by its own try block instead of
+            # len() and isinstance() chains. Containers that could be a str are
+            # still type-checked, since indexing a str would yield a character.
+            # JSON arrays always decode to plain lists, so exact type checks
+            # (type(x) is list) are used instead of isinstance.
+
             # Extract Review ID (index 0)
-            if len(review_array) > 0 and review_array[0]:
-                result["review_id"] = str(review_array[0])
+            if review_array[0]:
+                review_id = str(review_array[0])
             
             # Extract User and Metadata (index 1)
-            if len(review_array) > 1 and isinstance(review_array[1], list):
-                metadata = review_array[1]
-                
+            metadata = review_array[1]
+            if type(metadata) is list:
                 # Extract review timestamp from metadata[2] (Unix timestamp in microseconds)
-                if len(metadata) > 2 and metadata[2]:
-                    try:
-                        timestamp = int(metadata[2])
-                        # Convert microseconds to seconds for datetime
-                        timestamp_seconds = timestamp / 1000000
-                        review_datetime = datetime.fromtimestamp(timestamp_seconds)
-                        result["text_date"] = review_datetime.isoformat()
-                    except (ValueError, TypeError, OSError) as e:
-                        pass
+                try:
+                    if metadata[2]:
+                        text_date = iso_from_micros(int(metadata[2]))
+                except (LookupError, ValueError, TypeError, OSError, OverflowError):
+                    pass
                 
                 # User information at metadata[4][5]
-                if (
-                    len(metadata) > 4
-                    and isinstance(metadata[4], list)
-                    and len(metadata[4]) > 5
-                ):
+                try:
                     user_info = metadata[4][5]
-                    if isinstance(user_info, list):
-                        # User name (index 0)
-                        if len(user_info) > 0 and user_info[0]:
-                            result["user_name"] = str(user_info[0])
-                        # User profile URL (index 2, nested)
-                        if (
-                            len(user_info) > 2
-                            and isinstance(user_info[2], list)
-                            and len(user_info[2]) > 0
-                        ):
-                            result["user_url"] = str(user_info[2][0])
-                        # User reviews count (index 10, nested in array)
-                        if (
-                            len(user_info) > 10
-                            and isinstance(user_info[10], list)
-                            and len(user_info[10]) > 0
-                        ):
-                            reviews_text = str(user_info[10][0])
-                            match = re.search(r"(\d+)", reviews_text)
-                            if match:
-                                result["user_reviews"] = int(match.group(1))
+                except (LookupError, TypeError):
+                    user_info = None
+                if type(user_info) is list:
+                    # User name (index 0)
+                    try:
+                        if user_info[0]:
+                            user_name = str(user_info[0])
+                    except LookupError:
+                        pass
+                    # User profile URL (index 2, nested)
+                    try:
+                        if type(user_info[2]) is list:
+                            user_url = str(user_info[2][0])
+                    except LookupError:
+                        pass
+                    # User reviews count (index 10, nested in array)
+                    try:
+                        if type(user_info[10]) is list:
+                            user_reviews = _leading_int(str(user_info[10][0]))
+                    except LookupError:
+                        pass
                 
                 # Relative date at metadata[6]
-                if len(metadata) > 6 and metadata[6]:
-                    result["relative_date"] = str(metadata[6])
+                try:
+                    if metadata[6]:
+                        relative_date = str(metadata[6])
+                except LookupError:
+                    pass
             
             # Extract Review Content (index 2)
-            if len(review_array) > 2 and isinstance(review_array[2], list):
+            try:
                 content = review_array[2]
-                
+            except LookupError:
+                content = None
+            if type(content) is list:
                 # Rating at content[0] as [rating]
-                if (
-                    len(content) > 0
-                    and isinstance(content[0], list)
-                    and len(content[0]) > 0
-                ):
+                try:
                     if isinstance(content[0][0], (int, float)):
-                        result["rating"] = float(content[0][0])
+                        rating = float(content[0][0])
+                except (LookupError, TypeError):
+                    pass
                 
                 # Review text at content[15] as [[text, None, [start, end]]]
-                if (
-                    len(content) > 15
-                    and isinstance(content[15], list)
-                    and len(content[15]) > 0
-                ):
+                try:
                     text_container = content[15][0]
-                    if isinstance(text_container, list) and len(text_container) > 0:
-                        if isinstance(text_container[0], str):
-                            result["text"] = text_container[0]
+                    if type(text_container) is list and isinstance(
+                        text_container[0], str
+                    ):
+                        text = text_container[0]
+                except (LookupError, TypeError):
+                    pass
             
             # Extract Response Data (index 3)
-            if len(review_array) > 3 and isinstance(review_array[3], list):
+            try:
                 response_data = review_array[3]
-                
+            except LookupError:
+                response_data = None
+            if type(response_data) is list:
                 # Extract response timestamp from response_data[1] (Unix timestamp in microseconds)
-                if len(response_data) > 1 and response_data[1]:
-                    try:
-                        timestamp = int(response_data[1])
-                        # Convert microseconds to seconds for datetime
-                        timestamp_seconds = timestamp / 1000000
-                        response_datetime = datetime.fromtimestamp(timestamp_seconds)
-                        result["response_text_date"] = response_datetime.isoformat()
-                    except (ValueError, TypeError, OSError) as e:
-                        pass
+                try:
+                    if response_data[1]:
+                        response_text_date = iso_from_micros(
+                            int(response_data[1])
+                        )
+                except (LookupError, ValueError, TypeError, OSError, OverflowError):
+                    pass
                 
                 # Response date at response_data[3]
-                if len(response_data) > 3 and response_data[3]:
-                    result["response_relative_date"] = str(response_data[3])
+                try:
+                    if response_data[3]:
+                        response_relative_date = str(response_data[3])
+                except LookupError:
+                    pass
                 
                 # Response text at response_data[14] as [[text, None, [start, end]]]
-                if (
-                    len(response_data) > 14
-                    and isinstance(response_data[14], list)
-                    and len(response_data[14]) > 0
-                ):
+                try:
                     response_container = response_data[14][0]
-                    if (
-                        isinstance(response_container, list)
-                        and len(response_container) > 0
+                    if type(response_container) is list and isinstance(
+                        response_container[0], str
                     ):
-                        if isinstance(response_container[0], str):
-                            result["response_text"] = response_container[0]
+                        response_text = response_container[0]
+                except (LookupError, TypeError):
+                    pass
             
-            # Parse relative dates as fallback (if timestamp wasn't available)
-            # Only parse relative date if we don't already have text_date from timestamp
-            if result["relative_date"] and not result["text_date"]:
+            # Parse relative dates as fallback (if timestamp wasn't available).
+            # Timestamps are almost always present, so test for them first and
+            # skip relative date parsing on the common path
+            if text_date is None and relative_date:
                 try:
                     parsed_date = parse_relative_date(
-                        result["relative_date"], result["retrieval_date"]
+                        relative_date, retrieval_date, ref_dt=ref_dt
                     )
                     if parsed_date:
-                        result["text_date"] = parsed_date.isoformat()
+                        text_date = parsed_date.isoformat()
                 except Exception:
                     pass
 
             # Only parse relative response date if we don't already have response_text_date from timestamp
-            if result["response_relative_date"] and not result["response_text_date"]:
+            if response_text_date is None and response_relative_date:
                 try:
                     parsed_date = parse_relative_date(
-                        result["response_relative_date"], result["retrieval_date"]
+                        response_relative_date, retrieval_date, ref_dt=ref_dt
                     )
                     if parsed_date:
-                        result["response_text_date"] = parsed_date.isoformat()
+                        response_text_date = parsed_date.isoformat()
                 except Exception:
                     pass
 
         except Exception:
             pass
         
-        return result
+        return Review(
+            review_id=review_id,
+            user_name=user_name,
+            user_url=user_url,
+            user_reviews=user_reviews,
+            rating=rating,
+            relative_date=relative_date,
+            text=text,
+            text_date=text_date,
+            response_text=response_text,
+            response_relative_date=response_relative_date,
+            response_text_date=response_text_date,
+            retrieval_date=retrieval_date,
+        )
+
 
+# The parser holds no per-request state, so scrapers share this instance
+default_parser = GoogleMapsResponseParser()
@@ -1,24 +1,198 @@
 import asyncio
-import csv
+import email.utils
 import json
+import logging
+import operator
+import random
 import re
+import threading
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Literal
+from typing import IO, List, Dict, Any, Coroutine, Optional, Literal, TypeVar
 from urllib.parse import quote
 
 try:
-    from curl_cffi.requests import AsyncSession
+    from curl_cffi import CurlOpt
     CURL_CFFI_AVAILABLE = True
 except ImportError:
     CURL_CFFI_AVAILABLE = False
 
-from tqdm import tqdm
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-from .parser import GoogleMapsResponseParser
+from .models import Review
+from .parser import default_parser
 from .emulation import BrowserEmulator
 from .logger import setup_logger, get_logger
 
+_T = TypeVar("_T")
+
+
+# Feature ID embedded in Google Maps place URLs, e.g. "0x89c259a61c75684f:0x79d31adb123348d2"
+_FEATURE_ID_RE = re.compile(r"0[xX][0-9a-fA-F]+:0[xX][0-9a-fA-F]+")
+
+# Columns written to CSV output, and a getter that pulls them from a Review as a row tuple
+_CSV_FIELDNAMES = (
+    "review_id", "user_name", "user_url", "user_reviews",
+    "rating", "relative_date", "text_date", "text",
+    "response_text", "response_relative_date",
+    "response_text_date", "retrieval_date"
+)
+_CSV_ROW = operator.attrgetter(*_CSV_FIELDNAMES)
+
+# Static segments of the pb request parameter, based on observed browser behavior
+_PB_PREFIX = "!1m6!1s"
+_PB_COUNT = "!6m4!4m1!1e1!4m1!1e3!2m2!1i"
+_PB_TOKEN = "!2s"
+_PB_SUFFIX = (
+    "!5m2!1stest!7e81"
+    "!8m9!2b1!3b1!5b1!7b1!12m4!1b1!2b1!4m1!1e1"
+    "!11m4!1e3!2e1!6m1!1i2!13m1!1e1"
+)
+
+class ScrapeHTTPError(Exception):
+    """
+    Raised when the reviews API answers with a non-200 status.
+
+    Only the first 200 bytes of the response body are decoded, and only when
+    the error is formatted, so retried failures do not pay for decoding
+    large error pages.
+    """
+
+    def __init__(self, response: Any):
+        """
+        Initialize the error.
+
+        Args:
+            response: HTTP response with a non-200 status code
+        """
+        super().__init__(response.status_code)
+        self.status = response.status_code
+        self.response = response
+
+    def __str__(self) -> str:
+        snippet = self.response.content[:200].decode("utf-8", "replace")
+        return f"HTTP {self.status}: {snippet}"
+
+    @property
+    def retryable(self) -> bool:
+        """False for client errors (4xx) other than rate limiting (429)."""
+        return not (400 <= self.status < 500 and self.status != 429)
+
+    @property
+    def retry_after(self) -> Optional[float]:
+        """Seconds to wait from the Retry-After header, or None if absent or invalid."""
+        value = self.response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+
+class _RateLimiter:
+    """
+    Spaces request starts at least `interval` seconds apart.
+
+    Each caller reserves the next free slot and then sleeps until it, so
+    no lock is needed and concurrent scrapes share one request rate.
+    """
+
+    def __init__(self, interval: float):
+        """
+        Initialize the limiter.
+
+        Args:
+            interval: Minimum seconds between request starts (0 disables the limit)
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+
+    async def __aenter__(self):
+        if self.interval <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def __aexit__(self, exc_type, exc, tb):
+        pass
+
+
+class _TempFileWriter:
+    """
+    Append-only writer for the incremental recovery file.
+
+    Each page's new reviews are appended (JSON Lines for "json", rows for
+    "csv") instead of rewriting every review collected so far.
+    """
+
+    def __init__(self, path: Path, output_format: Literal["json", "csv"]):
+        """
+        Initialize the writer. The file is created on the first write.
+
+        Args:
+            path: Path to temporary file
+            output_format: Output format (json or csv)
+        """
+        self.path = path
+        self.output_format = output_format
+        self._file: Optional[IO[Any]] = None
+        self._csv_writer: Optional[Any] = None
+
+    def write(self, reviews: List[Review]):
+        """
+        Append reviews to the temporary file and flush them to disk.
+
+        Args:
+            reviews: Newly fetched Review records
+        """
+        if not reviews:
+            return
+
+        if self.output_format == "json":
+            if self._file is None:
+                # Binary so orjson's UTF-8 output is written without re-encoding
+                self._file = open(self.path, "wb")
+            if ORJSON_AVAILABLE:
+                self._file.write(b"".join(
+                    orjson.dumps(review.to_dict()) + b"\n" for review in reviews
+                ))
+            else:
+                self._file.write("".join(
+                    json.dumps(review.to_dict(), ensure_ascii=False) + "\n"
+                    for review in reviews
+                ).encode("utf-8"))
+        elif self.output_format == "csv":
+            if self._csv_writer is None:
+                import csv
+                self._file = open(self.path, "w", encoding="utf-8", newline="")
+                self._csv_writer = csv.writer(self._file)
+                self._csv_writer.writerow(_CSV_FIELDNAMES)
+            self._csv_writer.writerows(map(_CSV_ROW, reviews))
+
+        # Flush every page so the data survives an interrupted scrape
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """Close the temporary file if it was opened."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._csv_writer = None
+
 
 class GoogleMapsReviewsScraper:
     """
@@ -33,17 +207,24 @@ class GoogleMapsReviewsScraper:
         retry_time: float = 30,
         random_impersonate: bool = True,
         log_level: str = "INFO",
+        max_clients: int = 10,
+        fresh_connect: bool = False,
     ):
         """
         Initialize the Google Maps Reviews Scraper.
 
         Args:
             proxy: Proxy URL in format: http://username:password@ip:port
-            request_interval: Time to wait between requests in seconds
+            request_interval: Minimum time between request starts in seconds (0 for no limit)
             n_retries: Number of retries on request failure
-            retry_time: Time to wait before retrying in seconds
-            random_impersonate: If True, randomly select browser impersonation for each request
+            retry_time: Maximum time to wait before retrying in seconds (backoff cap)
+            random_impersonate: If True, randomly select browser impersonation for each scrape
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            max_clients: Connection pool size of each HTTP session
+            fresh_connect: If True, open a new connection for every request
+                           instead of reusing pooled ones. Use it if concurrent
+                           scrapes (scrape_reviews_many) hit connection-reuse
+                           errors in curl_cffi.
         """
         if not CURL_CFFI_AVAILABLE:
             raise ImportError(
@@ -51,18 +232,68 @@ class GoogleMapsReviewsScraper:
             )
 
         self.proxy = proxy
-        self.request_interval = request_interval
+        self._limiter = _RateLimiter(request_interval)
         self.n_retries = n_retries
         self.retry_time = retry_time
         self.random_impersonate = random_impersonate
         self.base_url = "https://www.google.com/maps/rpc/listugcposts"
         self.emulator = BrowserEmulator()
-        self.parser = GoogleMapsResponseParser()
+        self.parser = default_parser
+        self._session_kwargs: Dict[str, Any] = {
+            "proxies": {"http": proxy, "https": proxy} if proxy else None,
+            "max_clients": max_clients,
+        }
+        if fresh_connect:
+            self._session_kwargs["curl_options"] = {CurlOpt.FRESH_CONNECT: True}
 
         # Setup logger
-        import logging
         level = getattr(logging, log_level.upper(), logging.INFO)
         self.logger = setup_logger(level=level)
+
+        # While used as "async with scraper:", HTTP sessions stay open between
+        # scrape_reviews calls; otherwise the last running scrape closes them
+        self._in_context = False
+        self._active_scrapes = 0
+
+    @property
+    def request_interval(self) -> float:
+        """Minimum time between request starts in seconds (0 for no limit)."""
+        return self._limiter.interval
+
+    @request_interval.setter
+    def request_interval(self, value: float):
+        self._limiter.interval = value
+
+    async def __aenter__(self) -> "GoogleMapsReviewsScraper":
+        self._in_context = True
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """Close all open HTTP sessions."""
+        self._in_context = False
+        await self.emulator.close_sessions()
+    
+    def _finish(
+        self, pbar: Any, verbose: bool, msg: str, *args: Any, level: int = logging.INFO
+    ):
+        """
+        Close the progress bar and log how the scrape ended.
+        
+        Args:
+            pbar: Progress bar, or None when not verbose
+            verbose: Whether status messages are shown
+            msg: %-style log message
+            *args: Arguments for msg
+            level: Logging level of the message
+        """
+        if pbar is not None:
+            pbar.close()
+            print()  # Add newline after progress bar
+        if verbose:
+            self.logger.log(level, msg, *args)
     
     def _parse_url_to_feature_id(self, url: str) -> Optional[str]:
         """
@@ -74,8 +305,7 @@ class GoogleMapsReviewsScraper:
         Returns:
             Feature ID string or None if not found
         """
-        pattern = r"0[xX][0-9a-fA-F]+:0[xX][0-9a-fA-F]+"
-        match = re.search(pattern, url)
+        match = _FEATURE_ID_RE.search(url)
         if match:
             return match.group(0)
         return None
@@ -96,20 +326,24 @@ class GoogleMapsReviewsScraper:
         """
         encoded_feature_id = quote(feature_id)
         
-        # Build pb parameter based on observed browser behavior
-        pb_param = (
-            f"!1m6!1s{encoded_feature_id}"
-            f"!6m4!4m1!1e1!4m1!1e3"
-            f"!2m2!1i{count}!2s{next_page_token}"
-            f"!5m2!1stest!7e81"
-            f"!8m9!2b1!3b1!5b1!7b1!12m4!1b1!2b1!4m1!1e1"
-            f"!11m4!1e3!2e1!6m1!1i2!13m1!1e1"
+        return (
+            f"{_PB_PREFIX}{encoded_feature_id}{_PB_COUNT}{count}"
+            f"{_PB_TOKEN}{next_page_token}{_PB_SUFFIX}"
         )
-        return pb_param
+    
+    def _pick_impersonation(self) -> str:
+        """Pick the browser impersonation for a scrape."""
+        if self.random_impersonate:
+            return self.emulator.get_random()
+        return self.emulator.get_next()
     
     async def _make_request(
-        self, feature_id: str, next_page_token: str = "", hl: str = "en"
-    ) -> str:
+        self,
+        feature_id: str,
+        next_page_token: str = "",
+        hl: str = "en",
+        impersonate: Optional[str] = None,
+    ) -> bytes:
         """
         Make request to the Google Maps API.
         
@@ -117,9 +351,10 @@ class GoogleMapsReviewsScraper:
             feature_id: The place feature ID
             next_page_token: Pagination token
             hl: Language code
+            impersonate: Browser impersonation. If None, a new one is picked
             
         Returns:
-            Response text
+            Raw response body
         """
         pb_param = self._build_pb_parameter(feature_id, next_page_token, count=10)
         url = f"{self.base_url}?authuser=0&hl={hl}&gl=us&pb={pb_param}"
@@ -130,56 +365,18 @@ class GoogleMapsReviewsScraper:
             "referer": "https://www.google.com/maps/",
         }
         
-        # Get browser impersonation
-        if self.random_impersonate:
-            impersonate = self.emulator.get_random()
-        else:
-            impersonate = self.emulator.get_next()
+        if impersonate is None:
+            impersonate = self._pick_impersonation()
         
-        # Create session with impersonation and proxy
-        async with AsyncSession(
-            impersonate=impersonate,
-            proxies={"http": self.proxy, "https": self.proxy} if self.proxy else None,
-        ) as session:
+        # Reuse the cached session for this impersonation (keeps connections alive)
+        session = self.emulator.session_for(impersonate, **self._session_kwargs)
+        async with self._limiter:
             response = await session.get(url, headers=headers, timeout=30)
-            
-            if response.status_code != 200:
-                raise Exception(f"HTTP {response.status_code}: {response.text}")
-            
-            return response.text
-    
-    def _save_to_temp(
-        self, 
-        reviews: List[Dict[str, Any]], 
-        temp_file: Path,
-        output_format: Literal["json", "csv"]
-    ):
-        """
-        Save reviews to temporary file incrementally.
         
-        Args:
-            reviews: List of review dictionaries
-            temp_file: Path to temporary file
-            output_format: Output format (json or csv)
-        """
-        if output_format == "json":
-            # Save as JSON with proper encoding
-            with open(temp_file, "w", encoding="utf-8") as f:
-                json.dump(reviews, f, indent=2, ensure_ascii=False)
-        elif output_format == "csv":
-            # Save as CSV with proper encoding
-            if reviews:
-                fieldnames = [
-                    "review_id", "user_name", "user_url", "user_reviews",
-                    "rating", "relative_date", "text_date", "text",
-                    "response_text", "response_relative_date", 
-                    "response_text_date", "retrieval_date"
-                ]
-                
-                with open(temp_file, "w", encoding="utf-8", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                    writer.writeheader()
-                    writer.writerows(reviews)
+        if response.status_code != 200:
+            raise ScrapeHTTPError(response)
+        
+        return response.content
     
     async def scrape_reviews(
         self, 
@@ -230,13 +427,17 @@ class GoogleMapsReviewsScraper:
             raise ValueError(f"Could not extract feature ID from URL: {url}")
 
         if verbose:
-            self.logger.info(f"Starting scrape for feature: {feature_id}")
+            self.logger.info("Starting scrape for feature: %s", feature_id)
             if output_file:
-                self.logger.info(f"Output: {output_file} ({output_format})")
+                self.logger.info("Output: %s (%s)", output_file, output_format)
             if n_reviews:
-                self.logger.info(f"Target: {n_reviews} reviews")
+                self.logger.info("Target: %d reviews", n_reviews)
         
-        all_reviews = []
+        loop = asyncio.get_running_loop()
+        # One fingerprint per scrape, so every page reuses the same session
+        # and its open connections instead of handshaking as a new browser
+        impersonate = self._pick_impersonation()
+        all_reviews: List[Review] = []
         next_page_token = ""
         page = 0
         
@@ -244,110 +445,121 @@ class GoogleMapsReviewsScraper:
         # Use tmp folder in current directory
         temp_dir = Path.cwd() / "tmp"
         temp_dir.mkdir(exist_ok=True)
-        temp_file = temp_dir / f"gmaps_reviews_temp_{feature_id}.{output_format}"
+        temp_suffix = "jsonl" if output_format == "json" else output_format
+        temp_file = temp_dir / f"gmaps_reviews_temp_{feature_id}.{temp_suffix}"
+        temp_writer = _TempFileWriter(temp_file, output_format)
         
         # Setup progress bar if verbose
         pbar = None
         if verbose:
+            # Imported here so quiet scrapes do not pay tqdm's import time
+            from tqdm import tqdm
             if n_reviews:
-                pbar = tqdm(total=n_reviews, desc="Fetching reviews", unit=" reviews")
+                pbar = tqdm(
+                    total=n_reviews, desc="Fetching reviews", unit=" reviews",
+                    mininterval=0.5, miniters=10,
+                )
             else:
-                pbar = tqdm(desc="Fetching reviews", unit=" reviews", total=0)
+                pbar = tqdm(
+                    desc="Fetching reviews", unit=" reviews", total=0,
+                    mininterval=0.5, miniters=10,
+                )
         
+        self._active_scrapes += 1
         try:
             # Continue fetching until we have enough reviews or reach the end
+            limit_reached = False
             while True:
                 retries = self.n_retries
                 while retries > 0:
                     try:
                         # Make request
-                        response_text = await self._make_request(
-                            feature_id, next_page_token, hl
+                        response_body = await self._make_request(
+                            feature_id, next_page_token, hl, impersonate
                         )
                         
-                        # Parse response
-                        data = self.parser.parse_response(response_text)
+                        # Parse response in a worker thread so decoding a large
+                        # page does not block the event loop
+                        data = await loop.run_in_executor(
+                            None, self.parser.parse_response, response_body
+                        )
                         
                         if not data or len(data) < 3:
-                            if verbose:
-                                if pbar is not None:
-                                    pbar.close()
-                                    print()  # Add newline after progress bar
-                                self.logger.info(
-                                    f"Completed: {len(all_reviews)} reviews (API limit reached)"
-                                )
+                            self._finish(
+                                pbar, verbose,
+                                "Completed: %d reviews (API limit reached)", len(all_reviews),
+                            )
+                            pbar = None
+                            limit_reached = True
                             break
                         
                         # Extract pagination token
                         next_page_token = self.parser.extract_pagination_token(data)
                         
-                        # Track reviews count before adding new ones
-                        reviews_before = len(all_reviews)
-                        
                         # Extract reviews
                         reviews = self.parser.extract_reviews(data)
                         all_reviews.extend(reviews)
                         
-                        # Save to temporary file incrementally
-                        self._save_to_temp(all_reviews, temp_file, output_format)
+                        # Append only the new reviews to the temporary file
+                        temp_writer.write(reviews)
                         
                         # Update progress bar
                         if pbar is not None:
-                            reviews_added = len(all_reviews) - reviews_before
-                            pbar.update(reviews_added)
+                            pbar.update(len(reviews))
                         
                         # Break retry loop on success
                         break
                     
                     except Exception as e:
                         retries -= 1
-                        if retries == 0:
-                            if verbose:
-                                if pbar is not None:
-                                    pbar.close()
-                                    print()  # Add newline after progress bar
-                                self.logger.error(f"Failed after {self.n_retries} retries: {e}")
+                        # Client errors other than 429 will not succeed on retry
+                        fatal = isinstance(e, ScrapeHTTPError) and not e.retryable
+                        if retries == 0 or fatal:
+                            if fatal:
+                                self._finish(pbar, verbose, "Request failed: %s", e, level=logging.ERROR)
+                            else:
+                                self._finish(
+                                    pbar, verbose, "Failed after %d retries: %s", self.n_retries, e,
+                                    level=logging.ERROR,
+                                )
                             # Save what we have so far
                             if all_reviews and output_file:
                                 self._save_final_output(all_reviews, output_file, output_format)
-                                self.logger.info(f"Saved {len(all_reviews)} reviews before error")
+                                self.logger.info("Saved %d reviews before error", len(all_reviews))
                             raise
                         else:
                             if verbose:
                                 if pbar is not None:
                                     pbar.write(f"⚠ Retry {self.n_retries - retries}/{self.n_retries}: {str(e)[:60]}...")
                                 else:
-                                    self.logger.warning(f"Retry {self.n_retries - retries}/{self.n_retries}: {str(e)[:60]}...")
-                            await asyncio.sleep(self.retry_time)
+                                    self.logger.warning(
+                                        "Retry %d/%d: %.60s...", self.n_retries - retries, self.n_retries, e
+                                    )
+                            # Exponential backoff capped at retry_time, with full
+                            # jitter so capped retries do not fall into a fixed cadence
+                            attempt = self.n_retries - retries
+                            delay = random.uniform(0, min(self.retry_time, 2 ** attempt))
+                            if isinstance(e, ScrapeHTTPError) and e.retry_after is not None:
+                                delay = e.retry_after
+                            await asyncio.sleep(delay)
                 
+                if limit_reached:
+                    break
+
                 # Check if we've reached the target
                 if n_reviews and len(all_reviews) >= n_reviews:
-                    if verbose:
-                        if pbar is not None:
-                            pbar.close()
-                            print()  # Add newline after progress bar
-                        self.logger.info(f"Completed: {n_reviews} reviews (target reached)")
+                    self._finish(pbar, verbose, "Completed: %d reviews (target reached)", n_reviews)
+                    pbar = None
                     break
 
                 # Check if there are more pages
                 if not next_page_token:
-                    if verbose:
-                        if pbar is not None:
-                            pbar.close()
-                            print()  # Add newline after progress bar
-                        self.logger.info(f"Completed: {len(all_reviews)} reviews")
+                    self._finish(pbar, verbose, "Completed: %d reviews", len(all_reviews))
+                    pbar = None
                     break
                 
-                # Sleep between requests
-                await asyncio.sleep(self.request_interval)
                 page += 1
             
-            # Close progress bar if still open
-            if pbar is not None:
-                pbar.close()
-                if verbose:
-                    print()  # Add newline after progress bar
-
             # Trim to requested number
             final_reviews = all_reviews[:n_reviews] if n_reviews else all_reviews
 
@@ -355,24 +567,91 @@ class GoogleMapsReviewsScraper:
             if output_file:
                 self._save_final_output(final_reviews, output_file, output_format)
                 if verbose:
-                    self.logger.info(f"✓ Saved {len(final_reviews)} reviews to {output_file}")
+                    self.logger.info("✓ Saved %d reviews to %s", len(final_reviews), output_file)
 
             # Clean up temp file
+            temp_writer.close()
             if temp_file.exists():
                 temp_file.unlink()
 
-            return final_reviews
+            # Reviews are kept as slotted records internally and converted once here
+            return [review.to_dict() for review in final_reviews]
 
         except Exception as e:
             # On any error, temp file is already saved with latest data
             if verbose:
-                self.logger.error(f"✗ Error occurred. Recovery file: {temp_file}")
-                self.logger.info(f"Recoverable: {len(all_reviews)} reviews")
+                self.logger.error("✗ Error occurred. Recovery file: %s", temp_file)
+                self.logger.info("Recoverable: %d reviews", len(all_reviews))
+            raise
+
+        finally:
+            temp_writer.close()
+            # Outside a context manager nothing else will close the sessions,
+            # and they are bound to the running event loop. Concurrent scrapes
+            # share them, so only the last one to finish closes them
+            self._active_scrapes -= 1
+            if not self._in_context and self._active_scrapes == 0:
+                await self.emulator.close_sessions()
+    
+    async def scrape_reviews_many(
+        self,
+        urls: List[str],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Scrape reviews for several places concurrently.
+        
+        Pagination within one place is inherently serial (each page carries
+        the token for the next), so throughput comes from running several
+        places at once, bounded by a semaphore. request_interval applies to
+        all places together, so it caps the total request rate of the batch.
+        
+        Args:
+            urls: Google Maps URLs
+            max_concurrency: Maximum number of places scraped at the same time
+            return_exceptions: If True, a failed place yields its exception in
+                               the results instead of cancelling the others
+            **kwargs: Passed to scrape_reviews (e.g. n_reviews, hl, verbose).
+                      Do not pass output_file, it would be shared by all places.
+            
+        Returns:
+            One list of review dictionaries per URL, in the same order as urls
+            
+        Example:
+            results = await scraper.scrape_reviews_many(
+                urls, max_concurrency=3, n_reviews=50, verbose=False
+            )
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def scrape_one(url: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.scrape_reviews(url, **kwargs)
+
+        # Keep sessions open until every place is done; a finished scrape
+        # must not close sessions that others are still using
+        owns_sessions = not self._in_context
+        self._in_context = True
+        tasks = [asyncio.ensure_future(scrape_one(url)) for url in urls]
+        try:
+            results: List[Any] = await asyncio.gather(
+                *tasks, return_exceptions=return_exceptions
+            )
+            return results
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
             raise
+        finally:
+            if owns_sessions:
+                await self.close()
     
     def _save_final_output(
         self,
-        reviews: List[Dict[str, Any]],
+        reviews: List[Review],
         output_file: str,
         output_format: Literal["json", "csv"]
     ):
@@ -380,7 +659,7 @@ class GoogleMapsReviewsScraper:
         Save final output to file.
         
         Args:
-            reviews: List of review dictionaries
+            reviews: List of Review records
             output_file: Output file path
             output_format: Output format (json or csv)
         """
@@ -388,27 +667,29 @@ class GoogleMapsReviewsScraper:
         output_path.parent.mkdir(parents=True, exist_ok=True)
         
         if output_format == "json":
-            with open(output_path, "w", encoding="utf-8") as f:
-                json.dump(reviews, f, indent=2, ensure_ascii=False)
+            data = [review.to_dict() for review in reviews]
+            if ORJSON_AVAILABLE:
+                with open(output_path, "wb") as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
         elif output_format == "csv":
             if reviews:
-                fieldnames = [
-                    "review_id", "user_name", "user_url", "user_reviews",
-                    "rating", "relative_date", "text_date", "text",
-                    "response_text", "response_relative_date",
-                    "response_text_date", "retrieval_date"
-                ]
-                
+                import csv
                 with open(output_path, "w", encoding="utf-8", newline="") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
-                    writer.writeheader()
-                    writer.writerows(reviews)
+                    writer = csv.writer(f)
+                    writer.writerow(_CSV_FIELDNAMES)
+                    writer.writerows(map(_CSV_ROW, reviews))
 
 
 class GoogleMapsReviewsScraperSync:
     """
     Synchronous wrapper for GoogleMapsReviewsScraper.
     Provides a blocking interface for non-async codebases.
+
+    An instance runs its scrapes on one event loop, so calls made from several
+    threads are serialized; use one instance per thread to scrape in parallel.
     """
     
     def __init__(
@@ -419,17 +700,24 @@ class GoogleMapsReviewsScraperSync:
         retry_time: float = 30,
         random_impersonate: bool = True,
         log_level: str = "INFO",
+        max_clients: int = 10,
+        fresh_connect: bool = False,
     ):
         """
         Initialize the synchronous Google Maps Reviews Scraper.
 
         Args:
             proxy: Proxy URL in format: http://username:password@ip:port
-            request_interval: Time to wait between requests in seconds
+            request_interval: Minimum time between request starts in seconds (0 for no limit)
             n_retries: Number of retries on request failure
-            retry_time: Time to wait before retrying in seconds
-            random_impersonate: If True, randomly select browser impersonation
+            retry_time: Maximum time to wait before retrying in seconds (backoff cap)
+            random_impersonate: If True, randomly select browser impersonation for each scrape
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            max_clients: Connection pool size of each HTTP session
+            fresh_connect: If True, open a new connection for every request
+                           instead of reusing pooled ones. Use it if concurrent
+                           scrapes (scrape_reviews_many) hit connection-reuse
+                           errors in curl_cffi.
         """
         self._scraper = GoogleMapsReviewsScraper(
             proxy=proxy,
@@ -438,7 +726,56 @@ class GoogleMapsReviewsScraperSync:
             retry_time=retry_time,
             random_impersonate=random_impersonate,
             log_level=log_level,
+            max_clients=max_clients,
+            fresh_connect=fresh_connect,
         )
+        # One event loop, created on the first call, so HTTP sessions (and
+        # their connection pools) survive across calls until close(). The
+        # lock keeps threads from driving the loop at the same time
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "GoogleMapsReviewsScraperSync":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __del__(self):
+        # Fallback for callers that never call close(); a loop that is running
+        # (or belongs to a caller's async code) cannot be driven from here
+        loop = getattr(self, "_loop", None)
+        if loop is not None and not loop.is_running():
+            try:
+                self.close()
+            except Exception:
+                pass
+
+    def close(self):
+        """Close all open HTTP sessions and the wrapper's event loop."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+            if loop is None or loop.is_closed():
+                return
+            try:
+                loop.run_until_complete(self._scraper.close())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Run a coroutine on the wrapper's event loop, creating it on first use."""
+        try:
+            with self._lock:
+                if self._loop is None:
+                    self._loop = asyncio.new_event_loop()
+                    self._loop.run_until_complete(self._scraper.__aenter__())
+                return self._loop.run_until_complete(coro)
+        except BaseException:
+            # e.g. called from inside a running event loop: the coroutine was
+            # never started, so close it instead of leaving it unawaited
+            coro.close()
+            raise
     
     def scrape_reviews(
         self,
@@ -462,6 +799,33 @@ class GoogleMapsReviewsScraperSync:
         Returns:
             List of review dictionaries
         """
-        return asyncio.run(
-            self._scraper.scrape_reviews(url, n_reviews, hl, verbose, output_format, output_file)
+        return self._run(
+            self._scraper.scrape_reviews(
+                url, n_reviews, hl, verbose, output_format, output_file
+            )
+        )
+
+    def scrape_reviews_many(
+        self,
+        urls: List[str],
+        max_concurrency: int = 5,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Scrape reviews for several places concurrently (blocking call).
+        Args:
+            urls: Google Maps URLs
+            max_concurrency: Maximum number of places scraped at the same time
+            return_exceptions: If True, a failed place yields its exception in
+                               the results instead of cancelling the others
+            **kwargs: Passed to scrape_reviews (e.g. n_reviews, hl, verbose)
+
+        Returns:
+            One list of review dictionaries per URL, in the same order as urls
+        """
+        return self._run(
+            self._scraper.scrape_reviews_many(
+                urls, max_concurrency, return_exceptions, **kwargs
+            )
         )
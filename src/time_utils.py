@@ -4,11 +4,74 @@ Handles relative dates like "2 weeks ago" and converts them to datetime objects.
 """
 
 import re
+import time
 from datetime import datetime, timedelta
 from typing import Optional
 
+# Matches both "X time_unit ago" (e.g., "2 weeks ago") and "a/an time_unit ago"
+# (e.g., "a week ago", "an hour ago") in a single pass
+_RELATIVE_RE = re.compile(
+    r'(?:(?P<num>\d+)\s*(?P<unit>second|minute|hour|day|week|month|year)s?'
+    r'|an?\s+(?P<single>second|minute|hour|day|week|month|year))'
+    r'\s+ago'
+)
 
-def parse_relative_date(relative_date: str, reference_date: Optional[str] = None) -> Optional[datetime]:
+# Time unit -> factory turning the amount into a timedelta
+_UNIT_TO_DELTA = {
+    'second': lambda v: timedelta(seconds=v),
+    'minute': lambda v: timedelta(minutes=v),
+    'hour': lambda v: timedelta(hours=v),
+    'day': lambda v: timedelta(days=v),
+    'week': lambda v: timedelta(weeks=v),
+    # Approximate: 30 days per month
+    'month': lambda v: timedelta(days=v * 30),
+    # Approximate: 365 days per year
+    'year': lambda v: timedelta(days=v * 365),
+}
+
+# Exact phrases resolved by a dict lookup before any substring or regex work
+_FAST_RELATIVE = {
+    'just now': timedelta(0),
+    'now': timedelta(0),
+    'today': timedelta(0),
+    'yesterday': timedelta(days=1),
+}
+_ONE_DAY = timedelta(days=1)
+
+
+# Date formats accepted by parse_datetime_str besides ISO 8601
+_YMD_RE = re.compile(
+    r'^(\d{4})([-/])(\d{1,2})\2(\d{1,2})'
+    r'(?:[T ](\d{1,2}):(\d{1,2}):(\d{1,2})(?:\.(\d{1,6}))?)?\Z'
+)
+_DMY_RE = re.compile(r'^(\d{1,2})([-/])(\d{1,2})\2(\d{4})\Z')
+
+
+def reference_datetime(reference_date: Optional[str] = None) -> datetime:
+    """
+    Resolve the reference datetime that relative dates are calculated from.
+    
+    Args:
+        reference_date: Reference datetime string (ISO format).
+                       If None or invalid, uses current datetime
+    
+    Returns:
+        datetime object
+    """
+    if reference_date:
+        try:
+            return datetime.fromisoformat(reference_date)
+        except (ValueError, TypeError):
+            pass
+    return datetime.now()
+
+
+def parse_relative_date(
+    relative_date: str,
+    reference_date: Optional[str] = None,
+    *,
+    ref_dt: Optional[datetime] = None,
+) -> Optional[datetime]:
     """
     Parse relative date strings like "2 weeks ago", "3 months ago" to datetime.
     
@@ -16,6 +79,8 @@ def parse_relative_date(relative_date: str, reference_date: Optional[str] = None
         relative_date: The relative date string (e.g., "2 weeks ago", "a month ago")
         reference_date: The reference datetime string to calculate from (ISO format)
                        If None, uses current datetime
+        ref_dt: Already resolved reference datetime. Takes precedence over
+                reference_date, so callers parsing many dates can resolve it once
     
     Returns:
         datetime object or None if parsing fails
@@ -23,71 +88,27 @@ def parse_relative_date(relative_date: str, reference_date: Optional[str] = None
     if not relative_date:
         return None
     
-    # Parse reference date or use now
-    if reference_date:
-        try:
-            ref_dt = datetime.fromisoformat(reference_date)
-        except (ValueError, TypeError):
-            ref_dt = datetime.now()
-    else:
-        ref_dt = datetime.now()
+    if ref_dt is None:
+        ref_dt = reference_datetime(reference_date)
     
     relative_date = relative_date.lower().strip()
     
-    # Handle "just now" or "now"
-    if relative_date in ["just now", "now", "today"]:
-        return ref_dt
+    # Handle "just now", "now", "today" and a bare "yesterday"
+    delta = _FAST_RELATIVE.get(relative_date)
+    if delta is not None:
+        return ref_dt - delta
     
-    # Handle "yesterday"
+    # Handle "yesterday" inside a longer phrase
     if "yesterday" in relative_date:
-        return ref_dt - timedelta(days=1)
-    
-    # Pattern for "X time_unit ago" (e.g., "2 weeks ago", "a month ago")
-    patterns = [
-        (r'(\d+)\s*second[s]?\s+ago', 'seconds'),
-        (r'(\d+)\s*minute[s]?\s+ago', 'minutes'),
-        (r'(\d+)\s*hour[s]?\s+ago', 'hours'),
-        (r'(\d+)\s*day[s]?\s+ago', 'days'),
-        (r'(\d+)\s*week[s]?\s+ago', 'weeks'),
-        (r'(\d+)\s*month[s]?\s+ago', 'months'),
-        (r'(\d+)\s*year[s]?\s+ago', 'years'),
-    ]
-    
-    for pattern, unit in patterns:
-        match = re.search(pattern, relative_date)
-        if match:
-            value = int(match.group(1))
-            if unit == 'seconds':
-                return ref_dt - timedelta(seconds=value)
-            elif unit == 'minutes':
-                return ref_dt - timedelta(minutes=value)
-            elif unit == 'hours':
-                return ref_dt - timedelta(hours=value)
-            elif unit == 'days':
-                return ref_dt - timedelta(days=value)
-            elif unit == 'weeks':
-                return ref_dt - timedelta(weeks=value)
-            elif unit == 'months':
-                # Approximate: 30 days per month
-                return ref_dt - timedelta(days=value * 30)
-            elif unit == 'years':
-                # Approximate: 365 days per year
-                return ref_dt - timedelta(days=value * 365)
-    
-    # Handle "a/an X ago" patterns (e.g., "a week ago", "an hour ago")
-    single_patterns = [
-        (r'an?\s+second\s+ago', timedelta(seconds=1)),
-        (r'an?\s+minute\s+ago', timedelta(minutes=1)),
-        (r'an?\s+hour\s+ago', timedelta(hours=1)),
-        (r'an?\s+day\s+ago', timedelta(days=1)),
-        (r'an?\s+week\s+ago', timedelta(weeks=1)),
-        (r'an?\s+month\s+ago', timedelta(days=30)),
-        (r'an?\s+year\s+ago', timedelta(days=365)),
-    ]
-    
-    for pattern, delta in single_patterns:
-        if re.search(pattern, relative_date):
-            return ref_dt - delta
+        return ref_dt - _ONE_DAY
+    
+    # Handle "X time_unit ago" and "a/an time_unit ago"
+    match = _RELATIVE_RE.search(relative_date)
+    if match:
+        num = match.group('num')
+        if num:
+            return ref_dt - _UNIT_TO_DELTA[match.group('unit')](int(num))
+        return ref_dt - _UNIT_TO_DELTA[match.group('single')](1)
     
     # If we can't parse it, return None
     return None
@@ -106,29 +127,67 @@ def parse_datetime_str(date_str: str) -> Optional[datetime]:
     if not date_str:
         return None
     
-    # Common datetime formats
-    formats = [
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S",
-        "%Y-%m-%dT%H:%M:%S.%f",
-        "%Y-%m-%d",
-        "%d/%m/%Y",
-        "%m/%d/%Y",
-        "%d-%m-%Y",
-        "%Y/%m/%d",
-    ]
-    
-    for fmt in formats:
-        try:
-            return datetime.strptime(date_str, fmt)
-        except ValueError:
-            continue
-    
-    # Try ISO format
+    # Try ISO format first (a single C-level parse)
     try:
         return datetime.fromisoformat(date_str)
     except (ValueError, TypeError):
         pass
     
+    # Year first: YYYY-MM-DD / YYYY/MM/DD; only the dashed form takes a time of day
+    match = _YMD_RE.match(date_str)
+    if match:
+        year, sep, month, day, hour, minute, second, fraction = match.groups()
+        if hour is not None and sep == "/":
+            return None
+        try:
+            if hour is None:
+                return datetime(int(year), int(month), int(day))
+            return datetime(
+                int(year), int(month), int(day),
+                int(hour), int(minute), int(second),
+                int(fraction.ljust(6, "0")) if fraction else 0,
+            )
+        except ValueError:
+            return None
+    
+    # Year last: DD/MM/YYYY (falling back to MM/DD/YYYY) or DD-MM-YYYY
+    match = _DMY_RE.match(date_str)
+    if match:
+        first, sep, second_part, year = match.groups()
+        orders = [(second_part, first)]
+        if sep == "/":
+            orders.append((first, second_part))
+        for month, day in orders:
+            try:
+                return datetime(int(year), int(month), int(day))
+            except ValueError:
+                continue
+    
     return None
 
+
+def iso_from_micros(micros: int) -> str:
+    """
+    Format a Unix timestamp in microseconds as a local-time ISO 8601 string.
+    
+    Produces the same output as datetime.fromtimestamp(...).isoformat() using
+    integer arithmetic, without building a datetime object.
+    
+    Args:
+        micros: Unix timestamp in microseconds
+    
+    Returns:
+        ISO 8601 string (microseconds are omitted when zero)
+    
+    Raises:
+        OverflowError, OSError: If the timestamp is out of range for the platform
+    """
+    seconds, micros_rem = divmod(micros, 1000000)
+    t = time.localtime(seconds)
+    iso = (
+        f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+        f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+    )
+    if micros_rem:
+        iso = f"{iso}.{micros_rem:06d}"
+    return iso
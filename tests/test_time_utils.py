@@ -0,0 +1,101 @@
+"""
+Tests for the date parsing helpers in time_utils.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.time_utils import parse_datetime_str, parse_relative_date
+
+REFERENCE = "2024-03-10T12:00:00"
+
+
+@pytest.mark.parametrize(
+    "date_str, expected",
+    [
+        # %Y-%m-%d %H:%M:%S
+        ("2024-01-02 10:11:12", datetime(2024, 1, 2, 10, 11, 12)),
+        # %Y-%m-%dT%H:%M:%S
+        ("2024-01-02T10:11:12", datetime(2024, 1, 2, 10, 11, 12)),
+        # %Y-%m-%dT%H:%M:%S.%f
+        ("2024-01-02T10:11:12.123456", datetime(2024, 1, 2, 10, 11, 12, 123456)),
+        ("2024-01-02T10:11:12.5", datetime(2024, 1, 2, 10, 11, 12, 500000)),
+        # %Y-%m-%d
+        ("2024-01-02", datetime(2024, 1, 2)),
+        ("2024-1-2", datetime(2024, 1, 2)),
+        # %d/%m/%Y, falling back to %m/%d/%Y
+        ("05/01/2024", datetime(2024, 1, 5)),
+        ("5/1/2024", datetime(2024, 1, 5)),
+        ("13/01/2024", datetime(2024, 1, 13)),
+        ("01/13/2024", datetime(2024, 1, 13)),
+        # %d-%m-%Y
+        ("05-01-2024", datetime(2024, 1, 5)),
+        # %Y/%m/%d
+        ("2024/01/05", datetime(2024, 1, 5)),
+        ("2024/1/5", datetime(2024, 1, 5)),
+        # ISO 8601 forms accepted by datetime.fromisoformat
+        ("2024-01-02 10:11:12.123456", datetime(2024, 1, 2, 10, 11, 12, 123456)),
+        ("2024-01-02 10:11", datetime(2024, 1, 2, 10, 11)),
+    ],
+)
+def test_parse_datetime_str_formats(date_str, expected):
+    assert parse_datetime_str(date_str) == expected
+
+
+@pytest.mark.parametrize(
+    "date_str",
+    [
+        "",
+        "yesterday",
+        "2024-01-02\n",
+        " 2024-01-02",
+        "2024.01.02",
+        "2024-13-01",
+        "2024-01-02 25:00:00",
+        "31/02/2024",
+        "02-31-2024",
+        "01/05/24",
+        "2024/01/05 10:11:12",
+        "2024/01/05T10:11:12",
+        "05-01-2024 10:11:12",
+    ],
+)
+def test_parse_datetime_str_rejects_near_misses(date_str):
+    assert parse_datetime_str(date_str) is None
+
+
+@pytest.mark.parametrize(
+    "relative_date, expected",
+    [
+        ("just now", datetime(2024, 3, 10, 12, 0)),
+        ("now", datetime(2024, 3, 10, 12, 0)),
+        ("Today", datetime(2024, 3, 10, 12, 0)),
+        ("yesterday", datetime(2024, 3, 9, 12, 0)),
+        ("Edited yesterday", datetime(2024, 3, 9, 12, 0)),
+        ("5 minutes ago", datetime(2024, 3, 10, 11, 55)),
+        ("an hour ago", datetime(2024, 3, 10, 11, 0)),
+        ("10 days ago", datetime(2024, 2, 29, 12, 0)),
+        ("a week ago", datetime(2024, 3, 3, 12, 0)),
+        ("2 weeks ago", datetime(2024, 2, 25, 12, 0)),
+        ("2 Weeks Ago", datetime(2024, 2, 25, 12, 0)),
+        ("3weeks ago", datetime(2024, 2, 18, 12, 0)),
+        ("a month ago", datetime(2024, 2, 9, 12, 0)),
+        ("3 months ago", datetime(2023, 12, 11, 12, 0)),
+        ("1 year ago", datetime(2023, 3, 11, 12, 0)),
+        ("2 weeks ago, edited a day ago", datetime(2024, 2, 25, 12, 0)),
+        ("", None),
+        ("nonsense", None),
+        ("in 3 days", None),
+        ("a seconds ago", None),
+    ],
+)
+def test_parse_relative_date(relative_date, expected):
+    assert parse_relative_date(relative_date, REFERENCE) == expected
+
+
+def test_parse_relative_date_ref_dt_takes_precedence():
+    ref_dt = datetime(2020, 1, 8)
+    assert parse_relative_date("a week ago", REFERENCE, ref_dt=ref_dt) == datetime(
+        2020, 1, 1
+    )